@@ -1,11 +1,21 @@
 import logging
 from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 
 from polytropos.actions.evolve.__change import Change
 from polytropos.actions.evolve.__lookup import lookup
 from polytropos.actions.validator import VariableValidator
 from polytropos.ontology.composite import Composite
-from polytropos.ontology.variable import Variable, Decimal
+from polytropos.ontology.schema import Schema, TrackType
+from polytropos.ontology.variable import Variable, Decimal, VariableId
+from polytropos.util import nesteddicts
+
+def _path(schema: Schema, var_id: VariableId, track_type: TrackType) -> Tuple[str, ...]:
+    """The absolute path of a variable within a period (or within "immutable"), verifying the track it came from."""
+    var: Optional[Variable] = schema.get(var_id, track_type=track_type)
+    if var is None:
+        raise ValueError('Unrecognized variable ID "%s"' % var_id)
+    return var.absolute_path
 
 @dataclass
 class CalculateWeightGain(Change):
@@ -13,24 +23,33 @@ class CalculateWeightGain(Change):
     weight_var: str = VariableValidator(data_type=Decimal)
     weight_gain_var: str = VariableValidator(data_type=Decimal)
 
+    def __post_init__(self):
+        # Paths don't change over the course of a run, so resolve them once rather than once per composite.
+        self._weight_path: Tuple[str, ...] = _path(self.schema, self.weight_var, TrackType.TEMPORAL)
+        self._gain_path: Tuple[str, ...] = ("immutable",) + _path(self.schema, self.weight_gain_var,
+                                                                   TrackType.IMMUTABLE)
+
     def __call__(self, composite: Composite):
         logging.debug("Beginning CalculateWeightGain")
-        periods = list(composite.periods)
-        logging.debug("Observed the following periods: %s" % ", ".join(periods))
-        earliest = min(periods)
-        latest = max(periods)
+        earliest = latest = None
+        for period in composite.periods:
+            if earliest is None or period < earliest:
+                earliest = period
+            if latest is None or period > latest:
+                latest = period
+        logging.debug("Earliest period: %s; latest period: %s", earliest, latest)
 
-        earliest_weight = composite.get_observation(self.weight_var, earliest)
-        logging.debug("Earliest weight: %0.2f" % earliest_weight)
+        earliest_weight = nesteddicts.get(composite.content, (earliest,) + self._weight_path)
+        logging.debug("Earliest weight: %0.2f", earliest_weight)
 
-        latest_weight = composite.get_observation(self.weight_var, latest)
-        logging.debug("Latest weight: %0.2f" % latest_weight)
+        latest_weight = nesteddicts.get(composite.content, (latest,) + self._weight_path)
+        logging.debug("Latest weight: %0.2f", latest_weight)
 
         # I know, should have called it "weight change."
         weight_gain = round(latest_weight - earliest_weight, 2)
-        logging.debug("Weight gain: %0.2f" % weight_gain)
+        logging.debug("Weight gain: %0.2f", weight_gain)
 
-        composite.put_immutable(self.weight_gain_var, weight_gain)
+        nesteddicts.put(composite.content, self._gain_path, weight_gain)
         logging.debug("Finished CalculateWeightGain.")
 
 @lookup('genders')
@@ -42,9 +61,17 @@ class DetermineGender(Change):
 
     # @lookup("genders")
 
-    def __call__(self, composite: Composite):
-        person_name: str = composite.get_immutable(self.person_name_var)
-        lc_name = person_name.lower()
+    def __post_init__(self):
+        self._name_path: Tuple[str, ...] = ("immutable",) + _path(self.schema, self.person_name_var,
+                                                                   TrackType.IMMUTABLE)
+        self._gender_path: Tuple[str, ...] = ("immutable",) + _path(self.schema, self.gender_var, TrackType.IMMUTABLE)
 
-        gender = self.lookups["genders"][lc_name]
-        composite.put_immutable(self.gender_var, gender)
+        # Normalize the keys once so that mixed-case entries in the lookup table still match. (A missing table is
+        # reported by the @lookup decorator.)
+        genders: Dict[str, str] = self.lookups.get("genders", {})
+        self._genders: Dict[str, str] = {name.lower(): gender for name, gender in genders.items()}
+
+    def __call__(self, composite: Composite):
+        person_name: str = nesteddicts.get(composite.content, self._name_path)
+        gender = self._genders[person_name.lower()]
+        nesteddicts.put(composite.content, self._gender_path, gender)
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from polytropos.ontology.composite import Composite
 
@@ -11,25 +11,26 @@ class _Crawl:
     def __init__(self, composite: Composite):
         self.composite = composite
 
-    def _crawl_list(self, node: List, path: List, period: Optional[str]) -> None:
+    def _crawl_list(self, node: List, path: Tuple[str, ...], period: Optional[str]) -> None:
         for child in node:  # type: Dict
             self._crawl_folder(child, path, period)
 
-    def _crawl_named_list(self, node: Dict, path: List, period: Optional[str]) -> None:
+    def _crawl_named_list(self, node: Dict, path: Tuple[str, ...], period: Optional[str]) -> None:
         for child in node.values():  # type: Dict
             self._crawl_folder(child, path, period)
 
     # noinspection PyUnresolvedReferences
-    def _crawl_folder(self, node: Dict, path: List, period: Optional[str]) -> None:
+    def _crawl_folder(self, node: Dict, path: Tuple[str, ...], period: Optional[str]) -> None:
+        lookup = self.composite.schema.lookup
         keys: List = list(node.keys())  # May need to delete a key, so create a copy
         for key in keys:
             if key.startswith("_"):
-                logging.debug("Ignoring system variable %s" % nesteddicts.path_to_str(path + [key]))
+                logging.debug("Ignoring system variable %s", nesteddicts.path_to_str(path + (key,)))
                 continue
             value = node[key]
-            child_path = path + [key]
+            child_path = path + (key,)
 
-            var: Optional[Variable] = self.composite.schema.lookup(child_path)
+            var: Optional[Variable] = lookup(child_path)
             if var is None:
                 logging.warning("Unknown variable path %s in period %s of composite %s" %
                                 (nesteddicts.path_to_str(path), period or "immutable", self.composite.composite_id))
@@ -48,13 +49,14 @@ class _Crawl:
             else:
                 self._crawl(value, child_path, period)
 
-    def _record_exception(self, exception_type: str, path: List[str], value: Optional[Any], period: Optional[str]) -> None:
+    def _record_exception(self, exception_type: str, path: Tuple[str, ...], value: Optional[Any],
+                          period: Optional[str]) -> None:
         # Note: in the event that there is a list in the path, it will be omitted; hence, if there is more than one
         # exception in that list, you will only see a single example
-        error_path: List[str] = [period or "immutable", "qc", "_exceptions", exception_type] + path
+        error_path: Tuple[str, ...] = (period or "immutable", "qc", "_exceptions", exception_type) + path
         nesteddicts.put(self.composite.content, error_path, value)
 
-    def _crawl(self, node: Any, path: List, period: Optional[str]) -> None:
+    def _crawl(self, node: Any, path: Tuple[str, ...], period: Optional[str]) -> None:
         if len(path) == 0:
             self._crawl_folder(node, path, period)
             return
@@ -79,10 +81,10 @@ class _Crawl:
             raise ValueError
 
     def _cast_period(self, period: str) -> None:
-        self._crawl(self.composite.content[period], [], period)
+        self._crawl(self.composite.content[period], (), period)
 
     def _cast_immutable(self) -> None:
-        self._crawl(self.composite.content["immutable"], [], None)
+        self._crawl(self.composite.content["immutable"], (), None)
 
     def __call__(self) -> None:
         for period in self.composite.periods:
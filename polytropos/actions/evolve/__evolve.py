@@ -7,6 +7,7 @@ from functools import partial
 from typing import Dict, List, Optional, TYPE_CHECKING, Type, Iterator
 
 from polytropos.ontology.composite import Composite
+from polytropos.util import fastjson
 from polytropos.util.exceptions import ExceptionWrapper
 
 from polytropos.util.loader import load
@@ -17,6 +18,12 @@ if TYPE_CHECKING:
     from polytropos.ontology.paths import PathLocator
     from polytropos.ontology.schema import Schema
 
+def _load_lookup(lookups_dir: str, name: str) -> Dict:
+    """Nothing stops a Change from modifying its lookups, so every build reads and parses its own copy of each
+    table."""
+    with open(os.path.join(lookups_dir, name + '.json'), 'rb') as l:
+        return fastjson.loads(l.read())
+
 class _EvolveFactory:
     def __init__(self, path_locator: "PathLocator",
                  change_specs: List[Dict],
@@ -30,12 +37,8 @@ class _EvolveFactory:
         self.path_locator: "PathLocator" = path_locator
 
     def _load_lookups(self) -> Dict[str, Dict]:
-        loaded_lookups: Dict = {}
-        lookups = self.requested_lookups
-        for lookup in lookups:
-            with open(os.path.join(self.path_locator.lookups_dir, lookup + '.json'), 'r') as l:
-                loaded_lookups[lookup] = json.load(l)
-        return loaded_lookups
+        lookups_dir: str = self.path_locator.lookups_dir
+        return {lookup: _load_lookup(lookups_dir, lookup) for lookup in self.requested_lookups}
 
     def _construct_change(self, class_name: str, mappings: Dict[str, str], loaded_lookups: Dict[str, Dict]) -> Change:
         change_class: Type = self.change_classes[class_name]
@@ -1,21 +1,33 @@
 import logging
 import os
-import json
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Optional
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
+from typing import Dict, Optional, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
 
 from polytropos.ontology.composite import Composite
 
 from polytropos.ontology.schema import Schema
+from polytropos.util import fastjson
 from polytropos.util.exceptions import ExceptionWrapper
 
 from polytropos.util.loader import load
 from polytropos.actions.step import Step
 
 
+# The filter and directory prefixes for the current worker process, set once by _init_worker so that they don't have to
+# be pickled along with every file name.
+_worker_args: Optional[Tuple["Filter", str, str]] = None
+
+def _init_worker(step: "Filter", origin_prefix: str, target_prefix: str) -> None:
+    global _worker_args
+    _worker_args = (step, origin_prefix, target_prefix)
+
+def _process_composite(filename: str) -> Optional[ExceptionWrapper]:
+    assert _worker_args is not None
+    step, origin_prefix, target_prefix = _worker_args
+    return step.process_composite(origin_prefix, target_prefix, filename)
+
 @dataclass
 class Filter(Step):  # type: ignore # https://github.com/python/mypy/issues/5374
     """Iterates over each composite, removing some of them if they do not meet some criterion."""
@@ -30,26 +42,46 @@ class Filter(Step):  # type: ignore # https://github.com/python/mypy/issues/5374
 
     @abstractmethod
     def passes(self, composite: Composite) -> bool:
+        """True iff the composite should be retained. Must not modify the composite: retained composites are copied to
+        the target directory as-is."""
         pass
 
-    def process_composite(self, origin_dir: str, target_dir: str, filename: str) -> Optional[ExceptionWrapper]:
+    def process_composite(self, origin_prefix: str, target_prefix: str, filename: str) -> Optional[ExceptionWrapper]:
+        """Filter a single composite. The prefixes are directory paths ending in a path separator, so that the file
+        paths can be built by concatenation."""
         try:
-            with open(os.path.join(origin_dir, filename), 'r') as origin_file:
-                content: Dict = json.load(origin_file)
-                composite: Composite = Composite(self.schema, content)
-                if self.passes(composite):
-                    with open(os.path.join(target_dir, filename), 'w') as target_file:
-                        json.dump(composite.content, target_file)
+            with open(origin_prefix + filename, 'rb') as origin_file:
+                raw: bytes = origin_file.read()
+            composite: Composite = Composite(self.schema, fastjson.loads(raw))
+            if self.passes(composite):
+                # Filters don't alter the composites they retain, so there is no need to re-serialize: just copy the
+                # original bytes. Writing to a temporary file and renaming it into place means that a failure never
+                # leaves a partial composite in the target directory.
+                target_path: str = target_prefix + filename
+                temp_path: str = target_path + ".tmp"
+                try:
+                    with open(temp_path, 'wb') as target_file:
+                        target_file.write(raw)
+                    os.replace(temp_path, target_path)
+                except BaseException:
+                    if os.path.exists(temp_path):
+                        os.unlink(temp_path)
+                    raise
         except Exception as e:
             return ExceptionWrapper(e)
         return None
 
     def __call__(self, origin_dir: str, target_dir: str) -> None:
-        with ThreadPoolExecutor() as executor:
-            results = executor.map(
-                partial(self.process_composite, origin_dir, target_dir),
-                os.listdir(origin_dir)
-            )
+        # Parsing and filtering are CPU-bound, so use processes rather than threads. Handing each worker a contiguous
+        # run of (sorted) files amortizes the inter-process overhead.
+        filenames: List[str] = sorted(os.listdir(origin_dir))
+        workers: int = os.cpu_count() or 1
+        chunksize: int = max(1, len(filenames) // (4 * workers))
+        origin_prefix: str = os.path.join(origin_dir, "")
+        target_prefix: str = os.path.join(target_dir, "")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self, origin_prefix, target_prefix)) as executor:
+            results = executor.map(_process_composite, filenames, chunksize=chunksize)
             # TODO: Exceptions are supposed to propagate from a ProcessPoolExecutor. Why aren't mine?
             for result in results:  # type: Optional[ExceptionWrapper]
                 if result is not None:
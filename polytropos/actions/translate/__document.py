@@ -1,4 +1,4 @@
-from typing import Any, Iterator, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from polytropos.ontology.variable import Variable, VariableId
 
@@ -10,25 +10,22 @@ class SourceNotFoundException(RuntimeError):
 class DocumentValueProvider:
     def __init__(self, document: Dict[str, Any]):
         self.document: Dict[str, Any] = document
+        # Checked once here rather than on every lookup
+        self._empty: bool = not document
 
     def variable_value(self, variable: Variable, parent_id_to_stop: Optional[VariableId] = None) -> Any:
         """Function that finds a variable (given its id) in a document. The
         parent_id_to_stop parameter is used to limit the depth for the recursive search"""
         # TODO What type is parent supposed to be here? Play around to find out.
-        if len(self.document) == 0:
+        if self._empty:
             raise SourceNotFoundException
 
-        ancestors: Iterator[Variable] = variable.ancestors(parent_id_to_stop)
-        path: Iterator[str] = reversed([var.name for var in ancestors])
+        path: Tuple[str, ...] = variable.ancestor_name_path(parent_id_to_stop)
+        result: Any = self.document
         try:
-            return self.value(path)
-        except KeyError:
+            for name in path:
+                result = result[name]
+        # A TypeError means that we ran into something other than a dict before reaching the end of the path
+        except (KeyError, TypeError):
             raise SourceNotFoundException
-
-    def value(self, path: Iterator[str]) -> Any:
-        result: Any = self.document
-        for name in path:  # type: str
-            if not isinstance(result, dict):
-                raise KeyError
-            result = result[name]
         return result
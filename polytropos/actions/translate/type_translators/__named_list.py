@@ -22,9 +22,11 @@ class NamedListTranslator(BaseTypeTranslator[Dict[str, Dict[str, Any]]]):
         if source_value is None:
             raise RuntimeError("I don't think this should be possible, because SourceNotFoundException replaced it")
 
+        # This loop runs once per named list item in every document, so resolve the attribute lookups up front
+        translate = self.translator.translate
+        var_id: VariableId = self.variable.var_id
+        result: Dict[str, Dict[str, Any]] = self.result
         for key, item in source_value.items():  # type: str, Dict[str, Any]
-            if key in self.result:
-                # No duplicate keys
+            if key in result:
                 raise ValueError
-            self.result[key] = self.translator.translate(item, self.variable.var_id, source_id)
-            self.has_result = True
+            result[key] = translate(item, var_id, source_id)
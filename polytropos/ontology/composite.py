@@ -24,14 +24,15 @@ class Composite:
     @property
     def periods(self) -> Iterator[str]:
         """Iterate over all of the observation periods contained in this composite."""
-        yield from set(self.content.keys()) - {"immutable"}
+        # Iterate over a snapshot, so that callers may add or remove periods along the way
+        yield from [key for key in self.content if key != "immutable"]
 
     # TODO Check that this isn't trying to grab a list descendant
     def get_immutable(self, var_id: VariableId, treat_missing_as_null: bool = False) -> Optional[Any]:
         """Get an immutable variable from this composite."""
         var = self.as_var(var_id, track_type=TrackType.IMMUTABLE)
 
-        path = ["immutable"] + list(var.absolute_path)
+        path: Tuple[str, ...] = ("immutable",) + var.absolute_path
         try:
             return nesteddicts.get(self.content, path)
         except MissingDataError as e:
@@ -43,10 +44,10 @@ class Composite:
     def get_all_observations(self, var_id: VariableId) -> Iterator[Tuple[str, Any]]:
         """Iterate over all observations of a temporal variable from this composite."""
         var = self.as_var(var_id, track_type=TrackType.TEMPORAL)
-        var_path: List = list(var.absolute_path)
+        var_path: Tuple[str, ...] = var.absolute_path
         for period in self.periods:
             try:
-                yield period, nesteddicts.get(self.content, [period] + var_path)
+                yield period, nesteddicts.get(self.content, (period,) + var_path)
             except MissingDataError:
                 continue
 
@@ -54,9 +55,9 @@ class Composite:
     def get_observation(self, var_id: VariableId, period: str, treat_missing_as_null: bool = False) -> Optional[Any]:
         """Get the value of a temporal variable for a particular observation period."""
         var = self.as_var(var_id, track_type=TrackType.TEMPORAL)
-        var_path: List = list(var.absolute_path)
+        var_path: Tuple[str, ...] = var.absolute_path
         try:
-            return nesteddicts.get(self.content, [period] + var_path)
+            return nesteddicts.get(self.content, (period,) + var_path)
         except MissingDataError as e:
             if treat_missing_as_null:
                 return None
@@ -64,13 +65,13 @@ class Composite:
 
     def put_immutable(self, var_id: VariableId, value: Optional[Any]) -> None:
         var = self.as_var(var_id, track_type=TrackType.IMMUTABLE)
-        path: List = ["immutable"] + list(var.absolute_path)
+        path: Tuple[str, ...] = ("immutable",) + var.absolute_path
         nesteddicts.put(self.content, path, value)
 
     def put_observation(self, var_id: VariableId, period: str, value: Optional[Any]) -> None:
         """Assign (or overwrite) the value of a temporal variable into a particular time period's observation."""
         var = self.as_var(var_id, track_type=TrackType.TEMPORAL)
-        path: List = [period] + list(var.absolute_path)
+        path: Tuple[str, ...] = (period,) + var.absolute_path
         nesteddicts.put(self.content, path, value)
 
     def pop_observation(self, var_id: VariableId, period: str, treat_missing_as_null: bool = False) -> Optional[Any]:
@@ -80,12 +81,12 @@ class Composite:
 
     def del_observation(self, var_id: VariableId, period: str) -> None:
         var = self.as_var(var_id, track_type=TrackType.TEMPORAL)
-        path: List = [period] + list(var.absolute_path)
+        path: Tuple[str, ...] = (period,) + var.absolute_path
         nesteddicts.delete(self.content, path)
 
     def del_immutable(self, var_id: VariableId) -> None:
         var = self.as_var(var_id, track_type=TrackType.IMMUTABLE)
-        path: List = ["immutable"] + list(var.absolute_path)
+        path: Tuple[str, ...] = ("immutable",) + var.absolute_path
         nesteddicts.delete(self.content, path)
 
     def encode_list(self, mappings: Dict[str, VariableId], content: List[Dict]) -> Iterator[Dict]:
@@ -100,7 +101,7 @@ class Composite:
                     raise ValueError('No mapping specified from internal key "%s" to schema' % internal_key)
                 var_id: VariableId = mappings[internal_key]
                 var: Variable = self.schema.get(var_id)
-                path: List[str] = list(var.relative_path)
+                path: Tuple[str, ...] = var.relative_path
                 nesteddicts.put(ret, path, list_item[internal_key])
             yield ret
 
@@ -109,12 +110,12 @@ class Composite:
         :param mappings: A mapping between the variables and their string values.
         :param content: The content in the schema format.
         """
-        path_mappings: Dict[VariableId, List[str]] = {}
+        path_mappings: Dict[VariableId, Tuple[str, ...]] = {}
         for var_id in mappings.keys():
             var: Variable = self.schema.get(var_id)
             if var is None:
                 raise ValueError('Unrecognized variable ID "%s"' % var_id)
-            path_mappings[var_id] = list(var.relative_path)
+            path_mappings[var_id] = var.relative_path
 
         for list_item in content:
             ret = {}
@@ -140,7 +141,7 @@ class Composite:
                     raise ValueError('No mapping specified from internal key "%s" to schema' % internal_key)
                 var_id: VariableId = mappings[internal_key]
                 var: Variable = self.schema.get(var_id)
-                path: List[str] = list(var.relative_path)
+                path: Tuple[str, ...] = var.relative_path
                 nesteddicts.put(encoded, path, list_item[internal_key])
             ret[key] = encoded
         return ret
@@ -150,12 +151,12 @@ class Composite:
         :param mappings: A mapping between the variables and their string values.
         :param content: The content in the schema format.
         """
-        path_mappings: Dict[VariableId, List[str]] = {}
+        path_mappings: Dict[VariableId, Tuple[str, ...]] = {}
         for var_id in mappings.keys():
             var: Variable = self.schema.get(var_id)
             if var is None:
                 raise ValueError('Unrecognized variable ID "%s"' % var_id)
-            path_mappings[var_id] = list(var.relative_path)
+            path_mappings[var_id] = var.relative_path
 
         ret: Dict = {}
         for key, list_item in content.items():
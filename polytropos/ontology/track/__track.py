@@ -1,7 +1,7 @@
 import logging
+from contextlib import contextmanager
 from copy import deepcopy
-import json
-from typing import Iterator, Dict, TYPE_CHECKING, Any, Optional, List as ListType
+from typing import Iterator, Dict, TYPE_CHECKING, Any, Optional, List as ListType, cast
 from collections.abc import MutableMapping
 
 from polytropos.ontology.variable import (
@@ -12,6 +12,7 @@ import polytropos.ontology.variable
 from cachetools import cachedmethod
 from cachetools.keys import hashkey
 from functools import partial
+from polytropos.util import fastjson
 
 if TYPE_CHECKING:
     from polytropos.ontology.schema import Schema
@@ -31,6 +32,11 @@ class Track(MutableMapping):
         self.target = None
         self.schema: Optional["Schema"] = None
         self._cache: Dict[str, Any] = {}
+        # Incremented to invalidate every variable's memoized values at once; see Variable._sync_cache
+        self._generation: int = 0
+        # See bulk_update()
+        self._defer_invalidation: bool = False
+        self._invalidation_deferred: bool = False
         if source:
             source.target = self
 
@@ -85,9 +91,11 @@ class Track(MutableMapping):
 
     def __setitem__(self, key: "VariableId", value: Variable) -> None:
         self._variables[key] = value
+        self.invalidate_cache()
 
     def __delitem__(self, key: "VariableId") -> None:
         del self._variables[key]
+        self.invalidate_cache()
 
     def __len__(self) -> int:
         return len(self._variables)
@@ -113,15 +121,85 @@ class Track(MutableMapping):
     @cachedmethod(lambda self: self._cache, key=partial(hashkey, 'root'))
     def roots(self) -> ListType["Variable"]:
         """All the roots of this track's variable tree."""
-        return list(filter(
-            lambda variable: variable.parent is None,
-            self._variables.values()
-        ))
+        return [self._variables[var_id] for var_id in self.child_ids(None)]
+
+    @property  # type: ignore # Decorated property not supported
+    @cachedmethod(lambda self: self._cache, key=partial(hashkey, 'children_by_parent'))
+    def children_by_parent(self) -> Dict[Optional[VariableId], ListType[VariableId]]:
+        """The IDs of each variable's children, in track order, keyed by the parent's ID. The roots are keyed by None.
+        Built in a single pass over the track, and discarded along with the rest of the track cache."""
+        index: Dict[Optional[VariableId], ListType[VariableId]] = {}
+        for var_id, variable in self._variables.items():
+            index.setdefault(variable.parent, []).append(var_id)
+        return index
+
+    @property  # type: ignore # Decorated property not supported
+    @cachedmethod(lambda self: self._cache, key=partial(hashkey, 'names_by_parent'))
+    def names_by_parent(self) -> Dict[Optional[VariableId], Dict[str, VariableId]]:
+        """For each parent ID (None for the roots), a map from the names of its children to their IDs."""
+        index: Dict[Optional[VariableId], Dict[str, VariableId]] = {}
+        for var_id, variable in self._variables.items():
+            index.setdefault(variable.parent, {})[variable.name] = var_id
+        return index
+
+    @property  # type: ignore # Decorated property not supported
+    @cachedmethod(lambda self: self._cache, key=partial(hashkey, 'trees'))
+    def trees(self) -> Dict[VariableId, Dict]:
+        """The tree (see Variable.tree) below every variable in the track, keyed by variable ID. Assembled bottom-up in
+        a single pass, deepest variables first, so that each subtree is built once and shared with its ancestors."""
+        trees: Dict[VariableId, Dict] = {}
+        for variable in sorted(self._variables.values(), key=lambda v: v.depth, reverse=True):
+            tree: Dict[str, Any] = dict(
+                title=variable.name,
+                varId=variable.var_id,
+                dataType=variable.data_type,
+            )
+            child_ids: ListType[VariableId] = self.child_ids(variable.var_id)
+            if child_ids:
+                tree['children'] = [
+                    trees[child_id]
+                    for child_id in sorted(child_ids, key=lambda child_id: self._variables[child_id].sort_order)
+                ]
+            trees[variable.var_id] = tree
+        return trees
+
+    def child_ids(self, parent_id: Optional[VariableId]) -> ListType[VariableId]:
+        """The IDs of the variables whose parent is parent_id, or of the roots if parent_id is None."""
+        # mypy sees the cachedmethod wrapper rather than the dict it returns
+        children_by_parent = cast(Dict[Optional[VariableId], ListType[VariableId]], self.children_by_parent)
+        return children_by_parent.get(parent_id, [])
+
+    def num_children(self, parent_id: Optional[VariableId]) -> int:
+        """The number of variables whose parent is parent_id, or the number of roots if parent_id is None."""
+        return len(self.child_ids(parent_id))
+
+    @contextmanager
+    def bulk_update(self) -> Iterator[None]:
+        """Within this block, requests to invalidate the variables' caches (such as those made whenever a variable's
+        name, parent or sort order is assigned) clear only the track's own indices, which validation relies on. The
+        per-variable caches are cleared once, on exit. Memoized paths and ancestry may therefore be stale inside the
+        block, so it should only enclose changes that do not rely on one another's effects on them."""
+        if self._defer_invalidation:
+            # Nested blocks defer to the outermost one
+            yield
+            return
+        self._defer_invalidation = True
+        self._invalidation_deferred = False
+        try:
+            yield
+        finally:
+            self._defer_invalidation = False
+            if self._invalidation_deferred:
+                self.invalidate_variables_cache()
 
     def invalidate_variables_cache(self) -> None:
+        if self._defer_invalidation:
+            self._invalidation_deferred = True
+            self.invalidate_cache()
+            return
         logging.debug("Invalidating cache for all variables.")
-        for variable in self._variables.values():
-            variable.invalidate_cache()
+        # Each variable discards its memoized values the next time it finds itself behind the track's generation
+        self._generation += 1
         self.invalidate_cache()
 
     def invalidate_cache(self) -> None:
@@ -179,6 +257,8 @@ class Track(MutableMapping):
         variable = self._variables[var_id]
         if parent_id and parent_id not in self._variables:
             raise ValueError
+        if parent_id == var_id:
+            raise ValueError
         if parent_id and variable.check_ancestor(parent_id):
             raise ValueError
         old_parent = variable.parent
@@ -188,9 +268,11 @@ class Track(MutableMapping):
         if variable.descends_from_list != old_descends_from_list:
             variable.parent = old_parent
             raise ValueError
-        variable.update_sort_order(None, sort_order)
-        variable.sort_order = sort_order
-        self.invalidate_variables_cache()
+        # The new parent is in place, so the remaining changes can share a single invalidation
+        with self.bulk_update():
+            variable.update_sort_order(None, sort_order)
+            variable.sort_order = sort_order
+            self.invalidate_variables_cache()
 
     def descendants_that(self, data_type: str=None, targets: int=0, container: int=0, inside_list: int=0) \
             -> Iterator[VariableId]:
@@ -228,4 +310,4 @@ class Track(MutableMapping):
 
     def dumps(self) -> str:
         """A pretty JSON string representation of this track."""
-        return json.dumps(self.dump(), indent=2)
+        return fastjson.dumps_pretty(self.dump())
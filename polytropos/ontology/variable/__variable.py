@@ -1,19 +1,34 @@
+import calendar
 import logging
-import json
+import re
+import sys
 from abc import abstractmethod
-from collections import defaultdict
-from typing import List as ListType, Dict, Iterator, TYPE_CHECKING, Optional, Set, Any, NewType
-from functools import partial
-from cachetools import cachedmethod
-from cachetools.keys import hashkey
+from functools import lru_cache
+from typing import List as ListType, Dict, Iterator, TYPE_CHECKING, Optional, Set, Any, NewType, Tuple
+from polytropos.util import fastjson
 from polytropos.util.nesteddicts import path_to_str
-from datetime import datetime
 
 if TYPE_CHECKING:
     from polytropos.ontology.track import Track
 
 VariableId = NewType("VariableId", str)
 
+# Marks a memoized value that has not been computed yet, where None is a legitimate value.
+_UNSET: Any = object()
+
+# Writes an attribute without going through Variable.__setattr__, for memoized values that need no validation
+_set = object.__setattr__
+
+# A date in YYYY-MM-DD format, and the most days each month can have
+_DATE_PATTERN = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})$")
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Textual representations of binary values. Common capitalizations are listed so that most values need no lowercasing.
+_BINARY_VALUES: Dict[str, bool] = {
+    "1": True, "true": True, "True": True, "TRUE": True,
+    "0": False, "false": False, "False": False, "FALSE": False
+}
+
 
 class Validator:
     @staticmethod
@@ -21,10 +36,20 @@ class Validator:
         if not init:
             _check_folder_has_sources(variable, sources)
         if sources:
+            source_track: Optional["Track"] = variable.track.source
+            assert source_track is not None
+            var_class: type = variable.__class__
             for source in sources:
                 #_verify_source_parent(variable, source)
-                _verify_source_exists(variable, source)
-                _verify_source_compatible(variable, source)
+                source_var: Optional[Variable] = source_track.get(source)
+                if source_var is None:
+                    msg_template: str = 'Variable "%s" is attempting to add source variable "%s", which does not ' \
+                                        'exist in the source track "%s"'
+                    raise ValueError(msg_template % (variable.var_id, source, source_track.name))
+                if _incompatible_type(source_var.__class__, var_class):
+                    msg_template = 'Variable "%s" (%s) is attempting to add incompatible source variable %s (%s)'
+                    raise ValueError(msg_template % (variable.var_id, var_class.__name__, source,
+                                                     source_var.__class__.__name__))
 
     @staticmethod
     def validate_parent(variable: "Variable", parent: Optional[VariableId]) -> None:
@@ -32,6 +57,8 @@ class Validator:
             return
         if parent == "":
             raise ValueError("Parent id is an empty string")
+        if parent == variable.var_id:
+            raise ValueError("Variable cannot be its own parent")
         if parent not in variable.track:
             # invalid parent
             raise ValueError('Nonexistent parent')
@@ -48,20 +75,16 @@ class Validator:
     def validate_name(variable: "Variable", name: str) -> None:
         if '/' in name or '.' in name:
             raise ValueError
-        sibling_names = set(
-            variable.track[sibling].name
-            for sibling in variable.siblings
-            if sibling != variable.var_id
-        )
-        if name in sibling_names:
+        sibling_names: Dict[str, VariableId] = variable.track.names_by_parent.get(variable.parent, {})
+        existing: Optional[VariableId] = sibling_names.get(name)
+        if existing is not None and existing != variable.var_id:
             raise ValueError('Duplicate name with siblings')
 
     @staticmethod
     def validate_sort_order(variable: "Variable", sort_order: int, adding: bool = False) -> None:
         if sort_order < 0:
             raise ValueError
-        # This line is very slow. Consider adding a cache for variable.siblings.
-        if sort_order >= len(list(variable.siblings)) + (1 if adding else 0):
+        if sort_order >= variable.track.num_children(variable.parent) + (1 if adding else 0):
             raise ValueError('Invalid sort order')
 
     @staticmethod
@@ -85,16 +108,41 @@ class Validator:
         if variable.track.source is not None:
             cls.validate_sources(variable, variable.sources, init)
 
-        # TODO This line is extremely slow. I suspect that putting a cache on 'Variable.children' would solve it
         cls.validate_sort_order(variable, variable.sort_order, adding)
 
 
 class Variable:
+    __slots__ = (
+        'initialized', 'track', 'var_id', '_hash', 'name', 'sort_order', 'notes', 'earliest_epoch', 'latest_epoch',
+        'short_description', 'long_description', 'sources', 'parent',
+        '_relative_path', '_absolute_path', '_descends_from_list', '_first_list_ancestor', '_depth',
+        '_ancestor_skip', '_ancestor_name_paths', '_descendants', '_generation'
+    )
+
+    # The hash of var_id, maintained by _assign_var_id
+    _hash: int
+
+    # Memoized values that depend on this variable's position in the track. They are written with object.__setattr__,
+    # as they need no validation, and are discarded by _sync_cache once the track's generation moves past _generation.
+    _relative_path: Optional[Tuple[str, ...]]
+    _absolute_path: Optional[Tuple[str, ...]]
+    _descends_from_list: Optional[bool]
+    _first_list_ancestor: Optional["Variable"]
+    _depth: Optional[int]
+    _ancestor_skip: Optional[ListType[VariableId]]
+    _ancestor_name_paths: Dict[Optional[VariableId], Tuple[str, ...]]
+    _descendants: Dict[Tuple, ListType[VariableId]]
+    _generation: int
+
+    # Optional attributes included in dump() when they have a value
+    _DUMP_FIELDS = ('notes', 'earliest_epoch', 'latest_epoch', 'short_description', 'long_description', 'sources',
+                    'parent')
+
     def __init__(self, track: "Track", var_id: VariableId, name: str, sort_order: int,
                  notes: Optional[str] = None, earliest_epoch: Optional[str] = None, latest_epoch: Optional[str] = None,
                  short_description: Optional[str] = None, long_description: Optional[str] = None,
                  sources: Optional[ListType[VariableId]] = None, parent: Optional[VariableId] = None):
-        self.initialized = False
+        object.__setattr__(self, 'initialized', False)
 
         # The track to which this variable belongs
         self.track: "Track" = track
@@ -128,21 +176,41 @@ class Variable:
         # The container variable above this variable in the hierarchy, if any.
         self.parent: Optional[VariableId] = parent
 
-        self._cache: Dict = {}
+        self._reset_cache()
 
         self.initialized = True
 
     def __hash__(self) -> int:
-        return hash(self.var_id) if self.var_id is not None else 0
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, self.__class__) and other.var_id == self.var_id
+        # Variable IDs are interned, so equal IDs are usually identical and compare without examining characters
+        return self is other or (isinstance(other, self.__class__) and other.var_id == self.var_id)
 
     def __setattr__(self, attribute: str, value: Any) -> None:
-        if attribute != "initialized" and self.initialized:
+        # Private attributes hold memoized values, which need no validation
+        if attribute != "initialized" and attribute[0] != "_" and self.initialized:
             value = self.validate_attribute_value(attribute, value)
 
-        self.__dict__[attribute] = value
+        if attribute == "var_id":
+            self._assign_var_id(value)
+        else:
+            object.__setattr__(self, attribute, value)
+
+    def __setstate__(self, state: Tuple[Optional[Dict], Dict[str, Any]]) -> None:
+        # Copies and unpickled instances are restored slot by slot, bypassing attribute validation
+        _, slots = state
+        for attribute, value in slots.items():
+            object.__setattr__(self, attribute, value)
+        # String hashes differ between interpreter processes, so never trust a restored hash
+        self._assign_var_id(self.var_id)
+
+    def _assign_var_id(self, var_id: Optional[VariableId]) -> None:
+        """Stores the variable ID interned, along with its hash."""
+        if var_id is not None:
+            var_id = VariableId(sys.intern(var_id))
+        object.__setattr__(self, 'var_id', var_id)
+        object.__setattr__(self, '_hash', hash(var_id) if var_id is not None else 0)
 
     def validate_attribute_value(self, attribute: str, value: Any) -> Any:
         if attribute == 'var_id':
@@ -152,19 +220,21 @@ class Variable:
         elif attribute == 'sources':
             Validator.validate_sources(self, value)
             if self.track and isinstance(self, GenericList):
-                child_sources: Dict[VariableId, ListType[Variable]] = defaultdict(list)
+                child_sources: Dict[VariableId, ListType[Variable]] = {}
                 for child in self.children:
                     for source_id in child.sources:
-                        child_sources[source_id].append(child)
-                safe = set()
-                assert self.track.source is not None
+                        child_sources.setdefault(source_id, []).append(child)
+                # Child sources that do not (yet) descend from any of the new sources
+                unsafe: Set[VariableId] = set(child_sources)
+                source_track: Optional["Track"] = self.track.source
+                assert source_track is not None
                 for source_id in value:
-                    source_var = self.track.source[source_id]
-                    for child_source in child_sources:
-                        if source_var.check_ancestor(child_source):
-                            safe.add(child_source)
+                    if not unsafe:
+                        break
+                    source_var = source_track[source_id]
+                    unsafe -= {child_source for child_source in unsafe if source_var.check_ancestor(child_source)}
                 for child_source, children in child_sources.items():
-                    if child_source not in safe:
+                    if child_source in unsafe:
                         for child in children:
                             child.sources.remove(child_source)
         elif attribute == 'parent':
@@ -182,90 +252,125 @@ class Variable:
 
         return value
 
+    def _reset_cache(self) -> None:
+        _set(self, '_relative_path', None)
+        _set(self, '_absolute_path', None)
+        _set(self, '_descends_from_list', None)
+        _set(self, '_first_list_ancestor', _UNSET)
+        _set(self, '_depth', None)
+        _set(self, '_ancestor_skip', None)
+        _set(self, '_ancestor_name_paths', {})
+        _set(self, '_descendants', {})
+        _set(self, '_generation', self.track._generation)
+
+    def _sync_cache(self) -> None:
+        """Discards memoized values computed before the track last invalidated its variables' caches."""
+        if self._generation != self.track._generation:
+            self._reset_cache()
+
     def invalidate_cache(self) -> None:
-        logging.debug("Invaliding cache for variable %s." % self.var_id)
-        self._cache.clear()
+        logging.debug("Invaliding cache for variable %s.", self.var_id)
+        self._reset_cache()
 
     def update_sort_order(self, old_order: Optional[int] = None, new_order: Optional[int] = None) -> None:
+        track: "Track" = self.track
+        sibling_ids: ListType[VariableId] = self.siblings
         if old_order is None:
-            old_order = len(list(self.siblings)) + 1
+            old_order = len(sibling_ids) + 1
         if new_order is None:
-            new_order = len(list(self.siblings)) + 1
-        for sibling in self.siblings:
-            if sibling == self.var_id:
+            new_order = len(sibling_ids) + 1
+        for sibling_id in sibling_ids:
+            if sibling_id == self.var_id:
                 continue
+            sibling: "Variable" = track[sibling_id]
             diff = 0
-            if self.track[sibling].sort_order >= new_order:
+            if sibling.sort_order >= new_order:
                 diff += 1
-            if self.track[sibling].sort_order >= old_order:
+            if sibling.sort_order >= old_order:
                 diff -= 1
-            self.track[sibling].__dict__['sort_order'] += diff
+            if diff:
+                object.__setattr__(sibling, 'sort_order', sibling.sort_order + diff)
 
     @property
     def temporal(self) -> bool:
         return self.track.schema is not None and self.track.schema.is_temporal(self.var_id)
 
     @property
-    def siblings(self) -> Iterator[VariableId]:
-        if self.parent is None:
-            return map(lambda root: root.var_id, self.track.roots)
-        return map(
-            lambda child: child.var_id,
-            self.track[self.parent].children
-        )
+    def siblings(self) -> ListType[VariableId]:
+        """The IDs of the variables sharing this variable's parent, including this one. This is the track's own child
+        index, so it must not be modified."""
+        return self.track.child_ids(self.parent)
 
     @property
     def has_targets(self) -> bool:
         """True iff any downstream track contains a variable that depends on this one."""
         return any(self.targets())
 
+    def _uncached_lineage(self, attribute: str, unset: Any = None) -> ListType["Variable"]:
+        """This variable and those of its ancestors whose memoized `attribute` is still `unset`, outermost first.
+        Memoized values are computed from the parent's, and caches are cleared track-wide, so every ancestor of a
+        variable with a memoized value has one too. Filling the returned list in order therefore never recurses.
+        Raises ValueError if the variable's ancestry contains a cycle."""
+        lineage: ListType["Variable"] = []
+        track: "Track" = self.track
+        limit: int = len(track)
+        current: Optional["Variable"] = self
+        while current is not None:
+            current._sync_cache()
+            if getattr(current, attribute) is not unset:
+                break
+            if len(lineage) >= limit:
+                raise ValueError('Variable "%s" is its own ancestor' % self.var_id)
+            lineage.append(current)
+            current = track[current.parent] if current.parent else None
+        lineage.reverse()
+        return lineage
+
     @property
     def descends_from_list(self) -> bool:
         """True iff this or any upstream variable is a list or named list."""
-        if not self.parent:
-            return False
-        parent = self.track[self.parent]
-        return isinstance(parent, GenericList) or parent.descends_from_list
+        self._sync_cache()
+        if self._descends_from_list is None:
+            track: "Track" = self.track
+            for variable in self._uncached_lineage('_descends_from_list'):
+                if not variable.parent:
+                    _set(variable, '_descends_from_list', False)
+                else:
+                    parent = track[variable.parent]
+                    _set(variable, '_descends_from_list', isinstance(parent, GenericList) or parent.descends_from_list)
+        return self._descends_from_list  # type: ignore # Filled in above
 
-    @property  # type: ignore # Decorated property not supported
-    @cachedmethod(lambda self: self._cache, key=partial(hashkey, 'relative_path'))
-    def relative_path(self) -> ListType[str]:
+    @property
+    def relative_path(self) -> Tuple[str, ...]:
         """The path from this node to the nearest list or or root."""
-        if not self.parent:
-            return [self.name]
-        parent: "Variable" = self.track[self.parent]
-        if isinstance(parent, GenericList):
-            return [self.name]
-        parent_path: ListType = parent.relative_path
-        return parent_path + [self.name]
-
-    @property  # type: ignore # Decorated property not supported
-    @cachedmethod(lambda self: self._cache, key=partial(hashkey, 'absolute_path'))
-    def absolute_path(self) -> ListType[str]:
+        self._sync_cache()
+        if self._relative_path is None:
+            track: "Track" = self.track
+            for variable in self._uncached_lineage('_relative_path'):
+                parent: Optional["Variable"] = track[variable.parent] if variable.parent else None
+                if parent is None or isinstance(parent, GenericList):
+                    _set(variable, '_relative_path', (variable.name,))
+                else:
+                    _set(variable, '_relative_path', parent.relative_path + (variable.name,))
+        return self._relative_path  # type: ignore # Filled in above
+
+    @property
+    def absolute_path(self) -> Tuple[str, ...]:
         """The path from this node to the root."""
-        if not self.parent:
-            return [self.name]
-        parent_path: ListType = self.track[self.parent].absolute_path
-        return parent_path + [self.name]
+        self._sync_cache()
+        if self._absolute_path is None:
+            track: "Track" = self.track
+            for variable in self._uncached_lineage('_absolute_path'):
+                if not variable.parent:
+                    _set(variable, '_absolute_path', (variable.name,))
+                else:
+                    _set(variable, '_absolute_path', track[variable.parent].absolute_path + (variable.name,))
+        return self._absolute_path  # type: ignore # Filled in above
 
-    @property  # type: ignore # Decorated property not supported
-    @cachedmethod(lambda self: self._cache, key=partial(hashkey, 'tree'))
+    @property
     def tree(self) -> Dict:
         """A tree representing the descendants of this node. (For UI)"""
-        children = [
-            child.tree
-            for child in sorted(
-                self.children, key=lambda child: child.sort_order
-            )
-        ]
-        tree: Dict[str, Any] = dict(
-            title=self.name,
-            varId=self.var_id,
-            dataType=self.data_type,
-        )
-        if children:
-            tree['children'] = children
-        return tree
+        return self.track.trees[self.var_id]
 
     def dump(self) -> Dict:
         """A dictionary representation of this variable."""
@@ -274,40 +379,90 @@ class Variable:
             'data_type': self.data_type,
             'sort_order': self.sort_order
         }
-        for field_name, field_value in vars(self).items():
-            if field_name == 'name' or field_name == 'sort_order' or field_name == 'var_id' or field_name == 'track' or field_name == 'initialized':
-                continue
+        for field_name in self._DUMP_FIELDS:
+            field_value = getattr(self, field_name)
             if field_value:
                 representation[field_name] = field_value
         return representation
 
     def dumps(self) -> str:
         """A JSON-compatible representation of this variable. (For serialization.)"""
-        return json.dumps(self.dump(), indent=4)
+        return fastjson.dumps_pretty(self.dump())
+
+    @property
+    def depth(self) -> int:
+        """The number of ancestors of this variable."""
+        self._sync_cache()
+        if self._depth is None:
+            track: "Track" = self.track
+            for variable in self._uncached_lineage('_depth'):
+                _set(variable, '_depth', 0 if variable.parent is None else track[variable.parent].depth + 1)
+        return self._depth  # type: ignore # Filled in above
+
+    def _skip_pointers(self) -> ListType[VariableId]:
+        """Skip pointers for ancestry queries: element k is the ID of this variable's (2^k)th ancestor."""
+        self._sync_cache()
+        if self._ancestor_skip is None:
+            track: "Track" = self.track
+            for variable in self._uncached_lineage('_ancestor_skip'):
+                skip: ListType[VariableId] = []
+                if variable.parent is not None:
+                    skip.append(variable.parent)
+                    while True:
+                        k: int = len(skip) - 1
+                        further: ListType[VariableId] = track[skip[k]]._skip_pointers()
+                        if len(further) <= k:
+                            break
+                        skip.append(further[k])
+                _set(variable, '_ancestor_skip', skip)
+        return self._ancestor_skip  # type: ignore # Filled in above
+
+    def _ancestor_id(self, distance: int) -> VariableId:
+        """The ID of the ancestor that is `distance` generations above this variable, found by following skip pointers.
+        Requires 0 < distance <= self.depth."""
+        track: "Track" = self.track
+        current: "Variable" = self
+        k: int = 0
+        while distance:
+            if distance & 1:
+                current = track[current._skip_pointers()[k]]
+            distance >>= 1
+            k += 1
+        return current.var_id
 
     def check_ancestor(self, child_id: VariableId, stop_at_list: bool = False) -> bool:
-        variable = self.track[child_id]
+        """True iff this variable is an ancestor of child_id. If stop_at_list is True, also returns False if child_id's
+        immediate parent is a list."""
+        track: "Track" = self.track
+        variable = track[child_id]
         if variable.parent is None:
             return False
         if (
                 stop_at_list and
-                isinstance(self.track[variable.parent], GenericList)
+                isinstance(track[variable.parent], GenericList)
         ):
             return False
-        if variable.parent == self.var_id:
-            return True
-        return self.check_ancestor(variable.parent)
+        distance: int = variable.depth - self.depth
+        if distance <= 0:
+            return False
+        return variable._ancestor_id(distance) == self.var_id
 
     def get_first_list_ancestor(self) -> Optional["Variable"]:
-        parent_id = self.parent
-        if parent_id is None:
-            return None
-        parent = self.track[parent_id]
-        if isinstance(parent, GenericList):
-            return parent
-        return parent.get_first_list_ancestor()
+        self._sync_cache()
+        if self._first_list_ancestor is _UNSET:
+            track: "Track" = self.track
+            for variable in self._uncached_lineage('_first_list_ancestor', _UNSET):
+                parent_id = variable.parent
+                if parent_id is None:
+                    _set(variable, '_first_list_ancestor', None)
+                else:
+                    parent = track[parent_id]
+                    if isinstance(parent, GenericList):
+                        _set(variable, '_first_list_ancestor', parent)
+                    else:
+                        _set(variable, '_first_list_ancestor', parent.get_first_list_ancestor())
+        return self._first_list_ancestor
 
-    @cachedmethod(lambda self: self._cache, key=partial(hashkey, 'descendants_that'))
     def descendants_that(self, data_type: str=None, targets: int=0, container: int=0, inside_list: int=0) \
             -> Iterator[str]:
         """Provides a list of variable IDs descending from this variable that meet certain criteria.
@@ -316,11 +471,17 @@ class Variable:
         :param container: If -1, include only primitives; if 1, only containers.
         :param inside_list: If -1, include only elements outside lists; if 1, only inside lists.
         """
-        for variable_id in self.track.descendants_that(
-            data_type, targets, container, inside_list
-        ):
-            if self.check_ancestor(variable_id, stop_at_list=True):
-                yield variable_id
+        self._sync_cache()
+        key: Tuple = (data_type, targets, container, inside_list)
+        descendants: Optional[ListType[VariableId]] = self._descendants.get(key)
+        if descendants is None:
+            descendants = [
+                variable_id
+                for variable_id in self.track.descendants_that(data_type, targets, container, inside_list)
+                if self.check_ancestor(variable_id, stop_at_list=True)
+            ]
+            self._descendants[key] = descendants
+        return iter(descendants)
 
     def targets(self) -> Iterator[VariableId]:
         """Returns an iterator of the variable IDs for any variables that DIRECTLY depend on this one in the specified
@@ -332,11 +493,8 @@ class Variable:
 
     @property
     def children(self) -> Iterator["Variable"]:
-        # TODO Consider caching the list of children for each variable in Track.
-        return filter(
-            lambda variable: variable.parent == self.var_id,
-            self.track.values()
-        )
+        track: "Track" = self.track
+        return (track[child_id] for child_id in track.child_ids(self.var_id))
 
     @property
     def data_type(self) -> str:
@@ -353,18 +511,32 @@ class Variable:
             current = self.track[current.parent]
             yield current
 
+    def ancestor_name_path(self, parent_id_to_stop: Optional[VariableId]) -> Tuple[str, ...]:
+        """The names of the variables returned by `ancestors`, ordered from the outermost ancestor down to this
+        variable. That is, the path to this variable relative to parent_id_to_stop."""
+        self._sync_cache()
+        path: Optional[Tuple[str, ...]] = self._ancestor_name_paths.get(parent_id_to_stop)
+        if path is None:
+            path = tuple(reversed([var.name for var in self.ancestors(parent_id_to_stop)]))
+            self._ancestor_name_paths[parent_id_to_stop] = path
+        return path
+
 
 class Container(Variable):
-    pass
+    __slots__ = ()
 
 
 class Primitive(Variable):
+    __slots__ = ()
+
     @abstractmethod
     def cast(self, value: Optional[Any]) -> Optional[Any]:
         pass
 
 
 class Integer(Primitive):
+    __slots__ = ()
+
     def cast(self, value: Optional[Any]) -> Optional[int]:
         if value is None or value == "":
             return None
@@ -372,6 +544,8 @@ class Integer(Primitive):
 
 
 class Text(Primitive):
+    __slots__ = ()
+
     def cast(self, value: Optional[Any]) -> Optional[str]:
         if value is None or value == "":
             return None
@@ -379,6 +553,8 @@ class Text(Primitive):
 
 
 class Decimal(Primitive):
+    __slots__ = ()
+
     def cast(self, value: Optional[Any]) -> Optional[float]:
         if value is None or value == "":
             return None
@@ -386,31 +562,35 @@ class Decimal(Primitive):
 
 
 class Unary(Primitive):
+    __slots__ = ()
+
     def cast(self, value: Optional[Any]) -> Optional[bool]:
         if value is None or value == "":
             return None
-        if value is True:
+        if value is True or value == "x" or value == "X":
             return True
-        if not (isinstance(value, str) and value.lower() == "x"):
-            raise ValueError
-        return True
+        raise ValueError
 
 
 class Binary(Primitive):
+    __slots__ = ()
+
     def cast(self, value: Optional[Any]) -> Optional[bool]:
         if value is None or value == "":
             return None
         if isinstance(value, bool):
             return value
-        vl = value.lower()
-        if vl in {"1", "true"}:
-            return True
-        if vl in {"0", "false"}:
-            return False
-        raise ValueError
+        result: Optional[bool] = _BINARY_VALUES.get(value)
+        if result is None:
+            result = _BINARY_VALUES.get(value.lower())
+            if result is None:
+                raise ValueError
+        return result
 
 
 class Currency(Primitive):
+    __slots__ = ()
+
     def cast(self, value: Optional[Any]) -> Optional[float]:
         if value is None or value == "":
             return None
@@ -418,6 +598,8 @@ class Currency(Primitive):
 
 
 class Phone(Primitive):
+    __slots__ = ()
+
     def cast(self, value: Optional[Any]) -> Optional[str]:
         if value is None or value == "":
             return None
@@ -425,6 +607,8 @@ class Phone(Primitive):
 
 
 class Email(Primitive):
+    __slots__ = ()
+
     def cast(self, value: Optional[Any]) -> Optional[str]:
         if value is None or value == "":
             return None
@@ -432,6 +616,8 @@ class Email(Primitive):
 
 
 class URL(Primitive):
+    __slots__ = ()
+
     def cast(self, value: Optional[Any]) -> Optional[str]:
         if value is None or value == "":
             return None
@@ -439,26 +625,17 @@ class URL(Primitive):
 
 
 class Date(Primitive):
+    __slots__ = ()
+
     def cast(self, value: Optional[Any]) -> Optional[str]:
-        if value is None or value in {"", "000000"}:
+        if value is None:
             return None
-        if len(value) == 6 and value.isdecimal():
-            year: str = value[:4]
-            month: str = value[4:]
-            return "%s-%s-01" % (year, month)
-
-        if len(value) >= 10:
-            retained = value[:10]
-
-            # Will raise a ValueError if unexpected content
-            datetime.strptime(retained, "%Y-%m-%d")
-
-            return retained
-
-        raise ValueError
+        return _cast_date(value)
 
 
 class Folder(Container):
+    __slots__ = ()
+
     @property
     def has_targets(self) -> bool:
         return False
@@ -468,23 +645,20 @@ class Folder(Container):
 
 
 class GenericList(Container):
-    pass
+    __slots__ = ()
 
 
 class List(GenericList):
-    pass
+    __slots__ = ()
 
 
 class NamedList(GenericList):
-    pass
+    __slots__ = ()
 
-def _incompatible_type(source_var: Variable, variable: Variable) -> bool:
-    if variable.__class__ == List:
-        if source_var.__class__ not in {List, Folder}:
-            return True
-    elif source_var.__class__ != variable.__class__:
-        return True
-    return False
+def _incompatible_type(source_class: type, var_class: type) -> bool:
+    if var_class is List:
+        return source_class is not List and source_class is not Folder
+    return source_class is not var_class
 
 def _check_folder_has_sources(variable: "Variable", sources: ListType[VariableId]) -> None:
     if len(sources) > 0 and isinstance(variable, Folder):
@@ -517,21 +691,29 @@ def _verify_source_parent(variable: "Variable", source_var_id: VariableId) -> No
         )
         raise ValueError(msg)
 
-def _verify_source_exists(variable: "Variable", source_var_id: VariableId) -> None:
-    assert variable.track.source is not None
-    if source_var_id not in variable.track.source:
-        var_id: VariableId = variable.var_id
-        source_track_name: str = variable.track.source.name
-        msg_template: str = 'Variable "%s" is attempting to add source variable "%s", which does not exist in the ' \
-                            'source track "%s"'
-        raise ValueError(msg_template % (var_id, source_var_id, source_track_name))
+# Datasets repeat the same dates across many records, so remember the outcome for recently seen values. Invalid values
+# raise, and exceptions are not cached.
+@lru_cache(maxsize=4096)
+def _cast_date(value: str) -> Optional[str]:
+    if value in {"", "000000"}:
+        return None
+    if len(value) == 6 and value.isdecimal():
+        year: str = value[:4]
+        month: str = value[4:]
+        return "%s-%s-01" % (year, month)
+
+    if len(value) >= 10:
+        retained = value[:10]
+
+        match = _DATE_PATTERN.match(retained)
+        if match is None:
+            raise ValueError
+        yyyy, mm, dd = map(int, match.groups())
+        if yyyy < 1 or not 1 <= mm <= 12 or not 1 <= dd <= _DAYS_IN_MONTH[mm]:
+            raise ValueError
+        if mm == 2 and dd == 29 and not calendar.isleap(yyyy):
+            raise ValueError
 
-def _verify_source_compatible(variable: "Variable", source_var_id: VariableId) -> None:
-    assert variable.track.source is not None
-    source_var = variable.track.source[source_var_id]
-    if _incompatible_type(source_var, variable):
-        var_id: VariableId = variable.var_id
-        var_type: str = variable.__class__.__name__
-        source_var_type: str = source_var.__class__.__name__
-        msg_template: str = 'Variable "%s" (%s) is attempting to add incompatible source variable %s (%s)'
-        raise ValueError(msg_template % (var_id, var_type, source_var_id, source_var_type))
+        return retained
+
+    raise ValueError
@@ -0,0 +1,32 @@
+"""Thin wrapper around orjson, when it is installed, with a fallback to the standard library. orjson is considerably
+faster at (de)serializing documents, but it is an optional dependency."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    _HAS_ORJSON = False
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document."""
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN, Infinity and out-of-range numbers, all of which json.dump writes by default
+            pass
+    return json.loads(data)
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize an object to JSON indented by two spaces. Non-ASCII characters are emitted as-is. Meant for schema
+    dumps, which never contain NaN or infinite numbers: orjson would write those as null, where json writes NaN."""
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # orjson rejects non-string keys, which json converts to strings
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
@@ -8,7 +8,4 @@ def load(klass: Type) -> Dict[str, Type]:
     for cls in klass.__subclasses__():
         logging.debug('   Found subclass "%s" of "%s".' % (cls.__name__, klass.__name__))
         ret[cls.__name__] = cls
-    return {
-        cls.__name__: cls
-        for cls in klass.__subclasses__()
-    }
+    return ret
@@ -1,4 +1,4 @@
-from typing import Optional, Any, Iterable, Dict, List, Iterator
+from typing import Optional, Any, Iterable, Dict, Iterator, Sequence
 
 NO_DEFAULT = Ellipsis
 
@@ -8,22 +8,20 @@ class MissingDataError(ValueError):
 class IncompleteNestingError(ValueError):
     pass
 
-def _do_get(target: Any, nodes: List[str]) -> Optional[Any]:
-    if len(nodes) == 0:
-        return target
-
-    if not isinstance(target, dict):
-        raise IncompleteNestingError
+def _do_get(target: Any, nodes: Sequence[str]) -> Optional[Any]:
+    cur: Any = target
+    for key in nodes:  # type: str
+        if not isinstance(cur, dict):
+            raise IncompleteNestingError
 
-    key: str = nodes[0]
-    if key not in target:
-        raise MissingDataError
+        if key not in cur:
+            raise MissingDataError
 
-    cur: Any = target.get(key)
+        cur = cur[key]
 
-    return _do_get(cur, nodes[1:])
+    return cur
 
-def get(target: Dict, spec: List[str], default: Any=NO_DEFAULT, accept_none: bool=True) -> Any:
+def get(target: Dict, spec: Sequence[str], default: Any=NO_DEFAULT, accept_none: bool=True) -> Any:
     """Given a nested dict, traverse the specified path and return the value."""
     if spec == "":
         return target
@@ -55,36 +53,31 @@ def _get_or_init(target: Dict, key: str) -> Dict:
         raise IncompleteNestingError
     return ret
 
-def _do_put(target: Dict, spec_arr: List, value: Any) -> None:
+def _do_put(target: Dict, spec_arr: Sequence, value: Any) -> None:
     assert len(spec_arr) > 0
 
-    if len(spec_arr) == 1:
-        key = spec_arr[0]
-        target[key] = value
-        return
-
-    key = spec_arr[0]
-
-    _get_or_init(target, key)
+    cur: Dict = target
+    for i in range(len(spec_arr) - 1):
+        cur = _get_or_init(cur, spec_arr[i])
 
-    _do_put(target[key], spec_arr[1:], value)
+    cur[spec_arr[-1]] = value
 
 
-def put(target: Dict, spec: List[str], value: Any) -> None:
+def put(target: Dict, spec: Sequence[str], value: Any) -> None:
     """Given a nested dict, traverse the specified path and assign the value."""
     if len(spec) == 0:
         return
 
     _do_put(target, spec, value)
 
-def delete(target: Dict, spec: List[str]) -> None:
+def delete(target: Dict, spec: Sequence[str]) -> None:
     """Deletes the final node indicated."""
     name: str = spec[-1]
     root: Dict = get(target, spec[:-1], default={})
     if name in root:
         del root[name]
 
-def pop(target: Dict, spec: List[str], default: Any=NO_DEFAULT, accept_none: bool=True) -> Optional[Any]:
+def pop(target: Dict, spec: Sequence[str], default: Any=NO_DEFAULT, accept_none: bool=True) -> Optional[Any]:
     val: Any = get(target, spec, default, accept_none)
     delete(target, spec)
     return val
@@ -23,6 +23,9 @@ setuptools.setup(
         'click',
         'asciitree'
     ],
+    extras_require={
+        'fast': ['orjson']
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
@@ -143,11 +143,11 @@ def test_unary_true(do_simple_test: Callable, raw: Any):
 def test_unary_fails(do_cast_error_test: Callable, raw: Any):
     do_cast_error_test("Unary", raw)
 
-@pytest.mark.parametrize("raw", ["True", "TRUE", "1", True])
+@pytest.mark.parametrize("raw", ["True", "TRUE", "tRuE", "1", True])
 def test_binary_true(do_simple_test: Callable, raw: Any):
     do_simple_test("Binary", raw, True)
 
-@pytest.mark.parametrize("raw", ["False", "FALSE", "0", False])
+@pytest.mark.parametrize("raw", ["False", "FALSE", "fAlSe", "0", False])
 def test_binary_false(do_simple_test, raw: Any):
     do_simple_test("Binary", raw, False)
 
@@ -157,13 +157,16 @@ def test_binary_fails(do_cast_error_test: Callable, raw: Any):
 
 @pytest.mark.parametrize("raw, native", [
     ("2018-10-27", "2018-10-27"),
+    ("2020-02-29T12:00:00", "2020-02-29"),
     ("201810", "2018-10-01"),
     ("000000", None)
 ])
 def test_date(do_simple_test: Callable, raw: Any, native: str):
     do_simple_test("Date", raw, native)
 
-@pytest.mark.parametrize("raw", ["10/27/2018", "10/27/18", "spam"])
+# Space-padded fields and non-ASCII digits were accepted by strptime, but are not dates in YYYY-MM-DD format
+@pytest.mark.parametrize("raw", ["10/27/2018", "10/27/18", "spam", "2018-13-01", "2018-04-31", "2019-02-29",
+                                 "2019-01- 1", "\u0662\u0660\u0661\u0669-01-01"])
 def test_date_fails(do_cast_error_test, raw: Any):
     do_cast_error_test("Date", raw)
 
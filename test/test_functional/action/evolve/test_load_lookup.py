@@ -0,0 +1,16 @@
+from polytropos.actions.evolve.__evolve import _load_lookup
+
+
+def test_each_load_is_independent(tmpdir):
+    tmpdir.join("genders.json").write('{"alice": "F"}')
+    first = _load_lookup(str(tmpdir), "genders")
+    first["alice"] = "modified"
+    second = _load_lookup(str(tmpdir), "genders")
+    assert second == {"alice": "F"}
+
+
+def test_load_sees_changes_to_the_file(tmpdir):
+    tmpdir.join("genders.json").write('{"alice": "F"}')
+    assert _load_lookup(str(tmpdir), "genders") == {"alice": "F"}
+    tmpdir.join("genders.json").write('{"alice": "F", "bob": "M"}')
+    assert _load_lookup(str(tmpdir), "genders") == {"alice": "F", "bob": "M"}
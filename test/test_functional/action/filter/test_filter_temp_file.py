@@ -0,0 +1,27 @@
+import os
+from unittest.mock import MagicMock
+
+from polytropos.actions.filter import Filter
+from polytropos.ontology.composite import Composite
+from polytropos.ontology.schema import Schema
+
+
+class _KeepAll(Filter):
+    def passes(self, composite: Composite) -> bool:
+        return True
+
+
+def test_failed_write_removes_temp_file(tmpdir, monkeypatch):
+    origin_dir = tmpdir.mkdir("origin")
+    target_dir = tmpdir.mkdir("target")
+    origin_dir.join("composite_1.json").write('{"immutable": {}}')
+
+    def fail(src: str, dst: str) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    step: _KeepAll = _KeepAll(schema=MagicMock(spec=Schema))
+    result = step.process_composite(os.path.join(str(origin_dir), ""), os.path.join(str(target_dir), ""),
+                                    "composite_1.json")
+    assert result is not None
+    assert os.listdir(str(target_dir)) == []
@@ -74,6 +74,12 @@ def test_set_locally_non_unique_name_raises(source_nested_dict_track):
     with pytest.raises(ValueError):
         var.name = "third_source"
 
+def test_set_same_name_does_not_raise(source_nested_dict_track):
+    var: Variable = source_nested_dict_track["source_var_2"]
+    name: str = var.name
+    var.name = name
+    assert var.name == name
+
 @pytest.mark.parametrize("illegal_name", ["/I have a slash", "I.Have.Periods"])
 def test_set_illegal_name_raises(source_nested_dict_track, illegal_name):
     var: Variable = source_nested_dict_track["source_var_2"]
@@ -1,11 +1,14 @@
 """
-The tests check if a cache will be cleaned after updating the "parent" property of the variables.
+The tests check if a cache will be cleaned after updating the "parent" property of the variables. This covers both the
+track's roots and its index of children by parent.
 
 The `variable.parent` can be changed using `duplicate`, `add`, `delete`, `move` methods of a track
 instance as well as using direct modification of variables using `track[var_id].parent`.
 """
 from typing import Iterator
 
+import pytest
+
 from polytropos.ontology.track import Track
 from polytropos.ontology.variable import Variable
 
@@ -86,3 +89,108 @@ def test_direct_manipulation():
     _validate_roots(track.roots, 1)
     track["b"].parent = None
     _validate_roots(track.roots, 2)
+
+
+def _child_ids(track: Track, var_id: str):
+    return [child.var_id for child in track[var_id].children]
+
+
+def test_children_after_move():
+    track = Track.build(
+        {
+            "a": {"name": "a", "data_type": "Folder", "sort_order": 0},
+            "b": {"name": "b", "data_type": "Folder", "sort_order": 1},
+            "c": {"name": "c", "data_type": "Text", "parent": "a", "sort_order": 0},
+        },
+        None,
+        "children_move",
+    )
+    assert _child_ids(track, "a") == ["c"]
+    assert _child_ids(track, "b") == []
+    track.move("c", "b", 0)
+    assert _child_ids(track, "a") == []
+    assert _child_ids(track, "b") == ["c"]
+    assert list(track["c"].siblings) == ["c"]
+
+
+def test_children_after_direct_manipulation():
+    track = Track.build(
+        {
+            "a": {"name": "a", "data_type": "Folder", "sort_order": 0},
+            "b": {"name": "b", "data_type": "Text", "parent": "a", "sort_order": 0},
+        },
+        None,
+        "children_direct",
+    )
+    assert _child_ids(track, "a") == ["b"]
+    track["b"].parent = None
+    assert _child_ids(track, "a") == []
+    assert sorted(track["b"].siblings) == ["a", "b"]
+
+
+def test_children_after_add_and_delete():
+    track = Track.build(
+        {
+            "a": {"name": "a", "data_type": "Folder", "sort_order": 0},
+        },
+        None,
+        "children_add_delete",
+    )
+    track.add({"name": "b", "data_type": "Text", "parent": "a", "sort_order": 0}, "b")
+    assert _child_ids(track, "a") == ["b"]
+    track.delete("b")
+    assert _child_ids(track, "a") == []
+
+
+def test_list_ancestry_after_direct_manipulation():
+    track = Track.build(
+        {
+            "a": {"name": "a", "data_type": "List", "sort_order": 0},
+            "b": {"name": "b", "data_type": "Folder", "sort_order": 1},
+            "c": {"name": "c", "data_type": "Text", "parent": "b", "sort_order": 0},
+        },
+        None,
+        "list_ancestry",
+    )
+    assert not track["c"].descends_from_list
+    assert track["c"].get_first_list_ancestor() is None
+    track["b"].parent = "a"
+    assert track["c"].descends_from_list
+    assert track["c"].get_first_list_ancestor() is track["a"]
+
+
+def test_bulk_update_defers_invalidation():
+    track = Track.build(
+        {
+            "a": {"name": "a", "data_type": "Folder", "sort_order": 0},
+            "b": {"name": "b", "data_type": "Folder", "sort_order": 1},
+            "c": {"name": "c", "data_type": "Text", "parent": "a", "sort_order": 0},
+        },
+        None,
+        "bulk_update",
+    )
+    assert track["c"].absolute_path == ("a", "c")
+    with track.bulk_update():
+        track["a"].name = "renamed_a"
+        with track.bulk_update():
+            track["b"].name = "renamed_b"
+        # Still memoized from before the block
+        assert track["c"].absolute_path == ("a", "c")
+    assert track["c"].absolute_path == ("renamed_a", "c")
+    assert [root.name for root in track.roots] == ["renamed_a", "renamed_b"]
+
+
+def test_bulk_update_validates_against_current_names():
+    track = Track.build(
+        {
+            "a": {"name": "a", "data_type": "Folder", "sort_order": 0},
+            "b": {"name": "b", "data_type": "Folder", "sort_order": 1},
+        },
+        None,
+        "bulk_update",
+    )
+    with track.bulk_update():
+        track["a"].name = "x"
+        with pytest.raises(ValueError):
+            track["b"].name = "x"
+    assert [root.name for root in track.roots] == ["x", "b"]
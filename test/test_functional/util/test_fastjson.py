@@ -0,0 +1,44 @@
+import json
+import math
+
+import pytest
+
+from polytropos.util import fastjson
+from typing import *
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def use_orjson(request, monkeypatch) -> bool:
+    if request.param and not fastjson._HAS_ORJSON:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(fastjson, "_HAS_ORJSON", request.param)
+    return request.param
+
+def test_loads_bytes(use_orjson):
+    data: Dict = {
+        "immutable": {
+            "a": 1,
+            "b": [1.5, "two", None, True],
+            "c": {"d": "é"}
+        }
+    }
+    encoded: bytes = json.dumps(data).encode("utf-8")
+    assert fastjson.loads(encoded) == data
+
+def test_loads_accepts_str(use_orjson):
+    assert fastjson.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+def test_dumps_pretty(use_orjson):
+    data: Dict = {"a": {"b": [1, "é"], "c": {}}}
+    expected: str = "{\n  \"a\": {\n    \"b\": [\n      1,\n      \"é\"\n    ],\n    \"c\": {}\n  }\n}"
+    assert fastjson.dumps_pretty(data) == expected
+
+def test_loads_non_finite_numbers(use_orjson):
+    # What json.dump writes for non-finite floats, plus a literal that overflows a double
+    data: bytes = b'{"immutable": {"p": NaN, "q": Infinity}, "r": 1e400}'
+    loaded: Dict = fastjson.loads(data)
+    assert math.isnan(loaded["immutable"]["p"])
+    assert loaded["immutable"]["q"] == float("inf")
+    assert loaded["r"] == float("inf")
+
+def test_dumps_pretty_non_string_keys(use_orjson):
+    assert fastjson.dumps_pretty({1: "a"}) == json.dumps({1: "a"}, indent=2)
@@ -127,6 +127,20 @@ def test_put_parent_missing():
     expected: Dict = {"a": {"b": {"c": "value"}}}
     assert expected == target
 
+def test_get_tuple_spec():
+    data: Dict = {"a": {"b": {"c": "expected"}}}
+    spec: Tuple[str, ...] = ("a", "b", "c")
+    _do_get_test(data, spec)
+
+def test_put_tuple_spec():
+    target: Dict = {"a": {}}
+    spec: Tuple[str, ...] = ("a", "b", "c")
+    value: str = "value"
+    nesteddicts.put(target, spec, value)
+
+    expected: Dict = {"a": {"b": {"c": "value"}}}
+    assert expected == target
+
 def test_put_incomplete_nesting():
     target: Dict = {"a": "b"}
     spec: List[str] = ["a", "b", "c"]
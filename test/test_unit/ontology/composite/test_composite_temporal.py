@@ -75,6 +75,11 @@ def test_periods_none(simple_schema: Schema):
     composite: Composite = Composite(simple_schema, {})
     assert set(composite.periods) == set()
 
+def test_periods_removed_while_iterating(simple_composite: Composite):
+    for period in simple_composite.periods:
+        del simple_composite.content[period]
+    assert set(simple_composite.content.keys()) == {"immutable"}
+
 def test_get_all_observations(simple_composite):
     expected: Dict = {
         "2013": 172.3,
@@ -1,4 +1,5 @@
-from typing import Dict
+import sys
+from typing import Dict, List
 
 import pytest
 from polytropos.ontology.schema import Schema
@@ -40,3 +41,118 @@ def test_temporal_yes(schema):
 def test_temporal_no(schema):
     var: Variable = schema.get("the_immutable_var")
     assert not var.temporal
+
+@pytest.fixture()
+def deep_track() -> Track:
+    """A chain of 20 nested folders, each of which also has a Text leaf."""
+    spec: Dict = {}
+    parent = None
+    for i in range(20):
+        folder_spec: Dict = {"name": "folder_%i" % i, "data_type": "Folder", "sort_order": 0}
+        if parent is not None:
+            folder_spec["parent"] = parent
+        spec["folder_%i" % i] = folder_spec
+        if parent is not None:
+            spec["leaf_%i" % i] = {"name": "leaf_%i" % i, "data_type": "Text", "sort_order": 1, "parent": parent}
+        parent = "folder_%i" % i
+    return Track.build(spec, None, "deep")
+
+def _naive_check_ancestor(track: Track, ancestor_id: str, child_id: str) -> bool:
+    parent = track[child_id].parent
+    while parent is not None:
+        if parent == ancestor_id:
+            return True
+        parent = track[parent].parent
+    return False
+
+def test_check_ancestor_matches_parent_walk(deep_track):
+    for ancestor_id, ancestor in deep_track.items():
+        for child_id in deep_track.keys():
+            expected: bool = _naive_check_ancestor(deep_track, ancestor_id, child_id)
+            assert ancestor.check_ancestor(child_id) == expected, (ancestor_id, child_id)
+
+def test_check_ancestor_after_move(deep_track):
+    assert deep_track["folder_3"].check_ancestor("leaf_10")
+    deep_track.move("folder_9", None, 1)
+    assert not deep_track["folder_3"].check_ancestor("leaf_10")
+    assert deep_track["folder_9"].check_ancestor("leaf_10")
+
+def test_descendants_that_repeatable(deep_track):
+    expected = {"leaf_19"}
+    assert set(deep_track["folder_18"].descendants_that(data_type="Text")) == expected
+    assert set(deep_track["folder_18"].descendants_that(data_type="Text")) == expected
+
+def test_ancestry_deeper_than_recursion_limit():
+    depth: int = sys.getrecursionlimit() + 100
+    spec: Dict = {"folder_0": {"name": "folder_0", "data_type": "Folder", "sort_order": 0}}
+    for i in range(1, depth):
+        spec["folder_%i" % i] = {"name": "folder_%i" % i, "data_type": "Folder", "sort_order": 0,
+                                 "parent": "folder_%i" % (i - 1)}
+    track: Track = Track.build(spec, None, "very deep")
+    deepest: Variable = track["folder_%i" % (depth - 1)]
+    assert deepest.depth == depth - 1
+    assert len(deepest.absolute_path) == depth
+    assert deepest.relative_path == deepest.absolute_path
+    assert not deepest.descends_from_list
+    assert deepest.get_first_list_ancestor() is None
+    assert track["folder_0"].check_ancestor(deepest.var_id)
+
+def test_depth_after_move(deep_track):
+    assert deep_track["leaf_10"].depth == 10
+    deep_track.move("folder_5", None, 1)
+    assert deep_track["folder_5"].depth == 0
+    assert deep_track["leaf_10"].depth == 5
+    assert not deep_track["leaf_10"].check_ancestor("folder_5")
+    assert not deep_track["folder_5"].check_ancestor("folder_4")
+
+def test_hash_follows_var_id(deep_track):
+    var: Variable = deep_track["leaf_3"]
+    assert hash(var) == hash("leaf_3")
+    var.var_id = "renamed_leaf"
+    assert hash(var) == hash("renamed_leaf")
+    assert var in {var}
+
+def test_move_into_itself_raises(deep_track):
+    with pytest.raises(ValueError):
+        deep_track.move("folder_3", "folder_3", 0)
+    assert deep_track["folder_3"].parent == "folder_2"
+
+def test_parent_cycle_raises(deep_track):
+    with pytest.raises(ValueError):
+        deep_track["folder_3"].parent = "folder_3"
+    # Assigning a descendant as the parent is not caught on assignment, but ancestry queries refuse to loop
+    deep_track["folder_3"].parent = "folder_5"
+    with pytest.raises(ValueError):
+        deep_track["folder_3"].absolute_path
+    with pytest.raises(ValueError):
+        deep_track["leaf_10"].depth
+
+def test_invalidation_does_not_touch_every_variable(monkeypatch):
+    """Renames and moves invalidate memoized values for the whole track, but only the variables read afterward should
+    pay for it."""
+    spec: Dict = {
+        "folder_a": {"name": "folder_a", "data_type": "Folder", "sort_order": 0},
+        "folder_b": {"name": "folder_b", "data_type": "Folder", "sort_order": 1}
+    }
+    for i in range(1000):
+        spec["leaf_%i" % i] = {"name": "leaf_%i" % i, "data_type": "Text", "sort_order": i, "parent": "folder_a"}
+    track: Track = Track.build(spec, None, "wide")
+    for variable in track.values():
+        assert variable.absolute_path
+
+    resets: List[str] = []
+    original_reset = Variable._reset_cache
+
+    def counting_reset(self: Variable) -> None:
+        resets.append(self.var_id)
+        original_reset(self)
+
+    monkeypatch.setattr(Variable, "_reset_cache", counting_reset)
+    for i in range(50):
+        track["folder_b"].name = "renamed_%i" % i
+        track.move("leaf_%i" % i, "folder_b", 0)
+    assert len(resets) < 10 * 50
+
+    # Memoized values are discarded lazily, once the variable is next read
+    assert track["leaf_0"].absolute_path == ("renamed_49", "leaf_0")
+    assert track["leaf_999"].absolute_path == ("folder_a", "leaf_999")
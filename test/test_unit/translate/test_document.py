@@ -14,54 +14,10 @@ def create_variable(ancestor_names: List[str]) -> Any:
 
     ancestors: List[Any] = [create_variable_mock(name) for name in ancestor_names]
     ancestors[0].ancestors.return_value = ancestors
+    ancestors[0].ancestor_name_path.return_value = tuple(reversed(ancestor_names))
     return ancestors[0]
 
 
-@pytest.mark.parametrize("path, expected", [
-    (["a"], 1),
-    (["b"], 2),
-    (["c", "d"], "1"),
-    (["c", "e"], {"f": "2"}),
-    (["c", "e", "f"], "2"),
-])
-def test_value(path, expected):
-    doc: Dict[str, Any] = {
-        "a": 1,
-        "b": 2,
-        "c": {
-            "d": "1",
-            "e": {
-                "f": "2"
-            }
-        }
-    }
-
-    provider = DocumentValueProvider(doc)
-    assert provider.value(path) == expected
-
-
-@pytest.mark.parametrize("path", [
-    ["b"],
-    ["c", "f"],
-    ["c", "e", "z"],
-    ["c", "e", "f", "a"],
-])
-def test_missing_value(path):
-    doc: Dict[str, Any] = {
-        "a": 1,
-        "c": {
-            "e": {
-                "f": "2"
-            }
-        }
-    }
-
-    provider = DocumentValueProvider(doc)
-
-    with pytest.raises(KeyError):
-        _ = provider.value(path)
-
-
 @pytest.mark.parametrize("ancestor_names, expected", [
     (["a"], 1),
     (["b"], 2),
@@ -111,8 +67,5 @@ def test_empty_doc():
 
     provider = DocumentValueProvider(doc)
 
-    with pytest.raises(KeyError):
-        _ = provider.value(["a"])
-
     with pytest.raises(SourceNotFoundException):
         _ = provider.variable_value(create_variable(["b"]))
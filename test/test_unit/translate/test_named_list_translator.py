@@ -98,6 +98,24 @@ def test_duplicate_name_raises(translator, document, variable):
         _ = type_translator()
 
 
+def test_duplicate_name_raises_for_shared_translation(translator, document, variable):
+    """Duplicates are detected even if every item translates to the same object."""
+    def variable_value(var, _parent_id):
+        if var.var_id == "source1":
+            return {"a": 1}
+        return {"a": 2}
+
+    shared: dict = {}
+    variable.sources = ["source1", "source2"]
+    document.variable_value = variable_value
+    translator.translate = lambda doc, _parent_id, _source_parent_id: shared
+    parent_id = None
+
+    type_translator = NamedListTranslator(translator, document, variable, parent_id)
+    with pytest.raises(ValueError):
+        _ = type_translator()
+
+
 def test_translate_first_source_is_not_descendant(translator, document, variable):
     def variable_value(var, _parent_id):
         if var.var_id == "source1":
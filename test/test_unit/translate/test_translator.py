@@ -4,7 +4,6 @@ from unittest.mock import Mock
 import pytest
 
 from polytropos.actions.translate import Translator
-from polytropos.actions.translate.__document import SourceNotFoundException
 from polytropos.actions.translate.__type_translator_registry import TypeTranslatorRegistry
 
 
@@ -22,10 +21,7 @@ def target_track(source_track) -> Mock:
 def type_translator_class() -> Mock:
     def translator(_translator, document, variable, _parent_id):
         translated = Mock()
-        try:
-            source_value = document.value([variable.name])
-        except KeyError:
-            raise SourceNotFoundException
+        source_value = document.variable_value(variable)
 
         if isinstance(source_value, type) and issubclass(source_value, Exception):
             raise source_value
@@ -47,6 +43,7 @@ def create_variable(var_id: str, name: str, parent_id: Optional[str]) -> Any:
     var = Mock(var_id=var_id)
     var.name = name
     var.parent = parent_id
+    var.ancestor_name_path.return_value = (name,)
     return var
 
 